@@ -1,13 +1,213 @@
 #!/usr/bin/env python3
+import atexit
 import json
+import logging
+import math
 import os
-from typing import Dict, Any, List, Optional
+import sys
+import threading
+from collections import ChainMap
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, List, Mapping, Optional
 from pathlib import Path
 
+# orjson is optional; fall back to the stdlib encoder when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def json_loads(data) -> Any:
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def write_json_atomic(path: str, obj: Any, indent: bool = False, create_dirs: bool = True):
+    """Write JSON to a temp file next to path, fsync it and swap it in with os.replace
+    
+    Pass create_dirs=False when the directory is known to exist to skip the makedirs call.
+    """
+    # Serialize first so an encoding error never touches the disk
+    write_bytes_atomic(path, json_dumps(obj, indent=indent), create_dirs=create_dirs)
+
+
+def write_bytes_atomic(path: str, data: bytes, create_dirs: bool = True):
+    """Write already encoded bytes to path the same way as write_json_atomic"""
+    directory = os.path.dirname(path)
+    if create_dirs and directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    data = memoryview(data)
+    tmp_path = path + ".tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # Readers see either the old file or the new one, never a partial write
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class DebouncedJSONWriter:
+    """Coalesces bursts of saves of a JSON document into a single atomic write
+    
+    With on_conflict set, a write is skipped when another process has changed the file
+    since self.mtime. on_conflict must then re-read the file (updating self.mtime) and
+    schedule the merged data, which is written right away.
+    """
+    
+    def __init__(self, path: str, delay: float = 0.2, indent: bool = True, retry_delay: float = 5.0,
+                 on_conflict: Optional[Callable[[], None]] = None):
+        self.path = path
+        self.delay = delay
+        # A failed write is kept and tried again after this long
+        self.retry_delay = retry_delay
+        self.indent = indent
+        self.lock = threading.Lock()
+        # Held for a whole flush so writes land on disk in the order they were taken
+        self._write_lock = threading.Lock()
+        self.on_conflict = on_conflict
+        # (encoded data, tag) waiting to be written
+        self._data = None
+        self._timer = None
+        # Tag passed to schedule() with the data of the last successful write
+        self.written_tag = None
+        # Exception from the last write, None once a write succeeds
+        self.error = None
+        # st_mtime_ns of the file after our last write, or as the owner last read it;
+        # a different value on disk means another process has written the file
+        self.mtime = None
+        # Create the directory once here instead of on every write
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # Don't lose a pending write when the process exits
+        atexit.register(self.flush)
+    
+    def file_mtime(self) -> Optional[int]:
+        """Modification time of the file in ns, None if it doesn't exist"""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _start_timer(self, delay: float):
+        """Arm the flush timer unless it is already running, call with self.lock held"""
+        if self._timer is None:
+            self._timer = threading.Timer(delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def schedule(self, data: Any, tag: Any = None) -> bool:
+        """Queue data to be written after the debounce delay, replacing any pending data
+        
+        Returns False if data can't be encoded. While writes are failing, data is
+        written right away instead and the result is the outcome of that write.
+        """
+        # Encode now, on the caller's thread, so edits made to data before the timer
+        # fires can't change or break the pending write. The compact encoders are C
+        # loops that don't let other threads run mid-encode; indenting waits for flush.
+        try:
+            snapshot = json_dumps(data)
+        except Exception as e:
+            logger.error("Error encoding %s: %s", self.path, e)
+            return False
+        with self.lock:
+            self._data = (snapshot, tag)
+            failing = self.error is not None
+            if not failing:
+                self._start_timer(self.delay)
+        if failing:
+            # Report whether this save made it to disk, not the earlier failure
+            return self.flush()
+        return True
+    
+    def flush(self) -> bool:
+        """Write pending data now, returns False if the write failed"""
+        with self._write_lock:
+            with self.lock:
+                pending, self._data = self._data, None
+                timer, self._timer = self._timer, None
+            if timer is not None:
+                timer.cancel()
+            if pending is None:
+                return True
+            snapshot, tag = pending
+            # Only checked right before the write; a change landing in between still loses
+            conflict = self.on_conflict is not None and self.file_mtime() != self.mtime
+            if not conflict:
+                return self._write(snapshot, tag)
+        logger.warning("%s was changed by another process, merging before saving", self.path)
+        # Outside _write_lock: the owner re-reads the file and schedules the merged data
+        self.on_conflict()
+        return self.flush()
+    
+    def _write(self, snapshot: bytes, tag: Any) -> bool:
+        """Write one snapshot, call with _write_lock held"""
+        try:
+            if self.indent:
+                write_json_atomic(self.path, json_loads(snapshot), indent=True, create_dirs=False)
+            else:
+                write_bytes_atomic(self.path, snapshot, create_dirs=False)
+            self.mtime = self.file_mtime()
+            self.written_tag = tag
+            self.error = None
+            return True
+        except Exception as e:
+            self.error = e
+            logger.error("Error saving %s, retrying in %ss: %s", self.path, self.retry_delay, e)
+            with self.lock:
+                # Keep the data for the retry (and the exit flush) unless newer data was queued
+                if self._data is None:
+                    self._data = (snapshot, tag)
+                self._start_timer(self.retry_delay)
+            return False
+
 
 class ConfigManager:
     """Manages application configuration from settings.json"""
     
+    # Expected shape of the settings file, checked once when settings are loaded
+    SECTION_TYPES = {
+        "mqtt": dict,
+        "dmx": dict,
+        "logging": dict,
+        "scenes": dict,
+        "sequences": dict,
+        "web_server": dict,
+    }
+    DMX_SECTION_TYPES = {
+        "default_configs": list,
+        "artnet": dict,
+        "e131": dict,
+    }
+    DMX_TYPES = frozenset(("artnet", "e131"))
+    # dmx.frame_rate when it is missing or invalid
+    DEFAULT_FRAME_RATE = 44
+    
     def __init__(self, settings_path: str = None, print_on_load: bool = False):
         if settings_path is None:
             script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,20 +217,34 @@ class ConfigManager:
         
         self.settings_path = settings_path
         self.print_on_load = print_on_load
+        # Nesting depth of batch() and whether a save was deferred inside it
+        self._batch_depth = 0
+        self._save_pending = False
+        # mtime of the settings file as last loaded or saved, lets reload skip an unchanged file
+        self._settings_mtime = None
         self.settings = self.load_settings()
+        self._refresh_cache()
         
         # Print configuration if requested
         if self.print_on_load:
             self.print_full_config()
     
+    def _settings_file_mtime(self) -> Optional[int]:
+        """Modification time of the settings file in ns, None if it doesn't exist"""
+        try:
+            return os.stat(self.settings_path).st_mtime_ns
+        except OSError:
+            return None
+    
     def load_settings(self) -> Dict[str, Any]:
         """Load settings from JSON file"""
+        self._settings_mtime = self._settings_file_mtime()
         try:
-            if os.path.exists(self.settings_path):
-                with open(self.settings_path, 'r') as f:
-                    settings = json.load(f)
+            if self._settings_mtime is not None:
+                with open(self.settings_path, 'rb') as f:
+                    settings = json_loads(f.read())
                 print(f"Loaded settings from {self.settings_path}")
-                return settings
+                return self.validate_settings(settings)
             else:
                 print(f"Settings file not found at {self.settings_path}, using defaults")
                 return self.get_default_settings()
@@ -38,14 +252,56 @@ class ConfigManager:
             print(f"Error loading settings: {e}, using defaults")
             return self.get_default_settings()
     
+    def validate_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Check the settings shape once so the getters can index sections directly"""
+        if not isinstance(settings, dict):
+            raise ValueError("settings root must be an object")
+        
+        for section, expected in self.SECTION_TYPES.items():
+            value = settings.get(section)
+            if not isinstance(value, expected):
+                if value is not None:
+                    print(f"Invalid settings section '{section}', expected {expected.__name__}")
+                settings[section] = expected()
+        
+        dmx_settings = settings["dmx"]
+        for section, expected in self.DMX_SECTION_TYPES.items():
+            value = dmx_settings.get(section)
+            if not isinstance(value, expected):
+                if value is not None:
+                    print(f"Invalid settings section 'dmx.{section}', expected {expected.__name__}")
+                dmx_settings[section] = expected()
+        
+        # The sequencer divides by it to get its send interval
+        frame_rate = dmx_settings.get("frame_rate")
+        if frame_rate is not None and not (
+                isinstance(frame_rate, (int, float)) and not isinstance(frame_rate, bool)
+                and math.isfinite(frame_rate) and frame_rate > 0):
+            print(f"Invalid setting 'dmx.frame_rate', expected a positive number, using {self.DEFAULT_FRAME_RATE}")
+            dmx_settings["frame_rate"] = self.DEFAULT_FRAME_RATE
+        
+        return settings
+    
+    @contextmanager
+    def batch(self):
+        """Defer save_settings() calls until the outermost batch exits, then save once"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._save_pending:
+                self._save_pending = False
+                self.save_settings()
+    
     def save_settings(self) -> bool:
         """Save current settings to JSON file"""
+        if self._batch_depth:
+            self._save_pending = True
+            return True
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.settings_path), exist_ok=True)
-            
-            with open(self.settings_path, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            write_json_atomic(self.settings_path, self.settings, indent=True)
+            self._settings_mtime = self._settings_file_mtime()
             print(f"Settings saved to {self.settings_path}")
             return True
         except Exception as e:
@@ -103,51 +359,73 @@ class ConfigManager:
             }
         }
     
+    def reload_settings(self):
+        """Re-read settings from disk and rebuild the cached sections
+        
+        Does nothing if the file hasn't changed since it was last loaded or saved.
+        """
+        mtime = self._settings_file_mtime()
+        if mtime is not None and mtime == self._settings_mtime:
+            return
+        self.settings = self.load_settings()
+        self._refresh_cache()
+    
+    def _refresh_cache(self):
+        """Cache the validated sections and index DMX configs by name"""
+        settings = self.settings
+        self._mqtt = settings["mqtt"]
+        self._dmx = settings["dmx"]
+        self._dmx_configs = self._dmx["default_configs"]
+        self._dmx_by_name = {}
+        for config in self._dmx_configs:
+            if isinstance(config, dict) and "name" in config:
+                # Keep the first match, like the old linear scan did
+                self._dmx_by_name.setdefault(config["name"], config)
+        self._logging = settings["logging"]
+        self._scenes = settings["scenes"]
+        self._sequences = settings["sequences"]
+        self._web_server = settings["web_server"]
+    
     def get_mqtt_config(self) -> Dict[str, Any]:
         """Get MQTT configuration"""
-        return self.settings.get("mqtt", {})
+        return self._mqtt
     
     def get_dmx_configs(self) -> List[Dict[str, Any]]:
         """Get DMX sender configurations"""
-        return self.settings.get("dmx", {}).get("default_configs", [])
+        return self._dmx_configs
     
     def get_dmx_protocol_config(self, protocol: str) -> Dict[str, Any]:
         """Get configuration for specific DMX protocol"""
-        dmx_settings = self.settings.get("dmx", {})
-        if protocol.lower() == "artnet":
-            return dmx_settings.get("artnet", {})
-        elif protocol.lower() == "e131":
-            return dmx_settings.get("e131", {})
+        protocol = protocol.lower()
+        if protocol in self.DMX_TYPES:
+            return self._dmx[protocol]
         return {}
     
     def get_logging_config(self) -> Dict[str, Any]:
         """Get logging configuration"""
-        return self.settings.get("logging", {})
+        return self._logging
     
     def get_scenes_config(self) -> Dict[str, Any]:
         """Get scenes configuration"""
-        return self.settings.get("scenes", {})
+        return self._scenes
     
     def get_sequences_config(self) -> Dict[str, Any]:
         """Get sequences configuration"""
-        return self.settings.get("sequences", {})
+        return self._sequences
     
     def get_web_server_config(self) -> Dict[str, Any]:
         """Get web server configuration"""
-        return self.settings.get("web_server", {})
+        return self._web_server
     
     def update_mqtt_config(self, **kwargs) -> bool:
         """Update MQTT configuration"""
-        mqtt_config = self.settings.get("mqtt", {})
-        mqtt_config.update(kwargs)
-        self.settings["mqtt"] = mqtt_config
+        self.settings["mqtt"].update(kwargs)
         return self.save_settings()
     
     def update_dmx_configs(self, configs: List[Dict[str, Any]]) -> bool:
         """Update DMX sender configurations"""
-        dmx_settings = self.settings.get("dmx", {})
-        dmx_settings["default_configs"] = configs
-        self.settings["dmx"] = dmx_settings
+        self.settings["dmx"]["default_configs"] = configs
+        self._refresh_cache()
         return self.save_settings()
     
     def add_dmx_config(self, config: Dict[str, Any]) -> bool:
@@ -159,26 +437,29 @@ class ConfigManager:
     def remove_dmx_config(self, name: str) -> bool:
         """Remove a DMX sender configuration by name"""
         configs = self.get_dmx_configs()
-        configs = [config for config in configs if config.get("name") != name]
+        # Delete matches in place, walking backwards so indices stay valid
+        for i in range(len(configs) - 1, -1, -1):
+            if configs[i].get("name") == name:
+                del configs[i]
         return self.update_dmx_configs(configs)
     
     def get_dmx_config_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get DMX configuration by name"""
-        configs = self.get_dmx_configs()
-        for config in configs:
-            if config.get("name") == name:
-                return config
-        return None
+        return self._dmx_by_name.get(name)
     
     def validate_dmx_config(self, config: Dict[str, Any]) -> bool:
         """Validate DMX configuration"""
+        if not isinstance(config, dict):
+            print(f"DMX sender config must be an object, got {type(config).__name__}")
+            return False
+        
         required_fields = ["type", "name"]
         for field in required_fields:
             if field not in config:
                 print(f"Missing required field: {field}")
                 return False
         
-        if config["type"] not in ["artnet", "e131"]:
+        if config["type"] not in self.DMX_TYPES:
             print(f"Invalid DMX type: {config['type']}")
             return False
         
@@ -188,118 +469,131 @@ class ConfigManager:
         
         return True
     
-    def merge_with_command_line(self, cmd_args: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge command line arguments with settings"""
-        merged = self.settings.copy()
+    def merge_with_command_line(self, cmd_args: Dict[str, Any]) -> Mapping[str, Any]:
+        """Merge command line arguments with settings
+        
+        Returns a read-only overlay; self.settings itself is never modified.
+        """
+        overrides = {}
         
         # Override MQTT settings if provided
         if cmd_args.get("mqtt_url"):
-            merged["mqtt"]["url"] = cmd_args["mqtt_url"]
+            overrides["mqtt"] = ChainMap({"url": cmd_args["mqtt_url"]}, self.settings["mqtt"])
         
         # Override DMX configs if provided
         if cmd_args.get("dmx_configs"):
-            merged["dmx"]["default_configs"] = cmd_args["dmx_configs"]
+            overrides["dmx"] = ChainMap({"default_configs": cmd_args["dmx_configs"]}, self.settings["dmx"])
         
-        return merged
+        return ChainMap(overrides, self.settings)
     
     def print_current_config(self):
         """Print current configuration"""
-        print("Current Configuration:")
-        print("=" * 50)
-        
-        # MQTT Configuration
+        # Build the report first and write it in one go
         mqtt_config = self.get_mqtt_config()
-        print(f"MQTT URL: {mqtt_config.get('url', 'Not set')}")
-        print(f"MQTT Port: {mqtt_config.get('port', 'Not set')}")
-        print(f"MQTT Client ID: {mqtt_config.get('client_id', 'Not set')}")
-        
-        # DMX Configurations
         dmx_configs = self.get_dmx_configs()
-        print(f"\nDMX Senders ({len(dmx_configs)}):")
-        for i, config in enumerate(dmx_configs, 1):
-            print(f"  {i}. {config.get('name', 'Unnamed')} ({config.get('type', 'Unknown')})")
-            print(f"     Target: {config.get('target', 'Not set')}")
-            print(f"     Universe: {config.get('universe', 'Not set')}")
-        
-        # Other settings
         logging_config = self.get_logging_config()
-        print(f"\nLogging Level: {logging_config.get('level', 'Not set')}")
-        
         scenes_config = self.get_scenes_config()
-        print(f"Default Transition Time: {scenes_config.get('default_transition_time', 'Not set')}s")
-        
-        # Web Server Configuration
         web_config = self.get_web_server_config()
-        print(f"Web Server Enabled: {web_config.get('enabled', 'Not set')}")
-        print(f"Web Server Port: {web_config.get('port', 'Not set')}")
         
-        print("=" * 50)
+        parts = [
+            "Current Configuration:",
+            "=" * 50,
+            
+            # MQTT Configuration
+            f"MQTT URL: {mqtt_config.get('url', 'Not set')}",
+            f"MQTT Port: {mqtt_config.get('port', 'Not set')}",
+            f"MQTT Client ID: {mqtt_config.get('client_id', 'Not set')}",
+            
+            # DMX Configurations
+            f"\nDMX Senders ({len(dmx_configs)}):",
+        ]
+        for i, config in enumerate(dmx_configs, 1):
+            parts.append(f"  {i}. {config.get('name', 'Unnamed')} ({config.get('type', 'Unknown')})")
+            parts.append(f"     Target: {config.get('target', 'Not set')}")
+            parts.append(f"     Universe: {config.get('universe', 'Not set')}")
+        
+        parts += [
+            # Other settings
+            f"\nLogging Level: {logging_config.get('level', 'Not set')}",
+            f"Default Transition Time: {scenes_config.get('default_transition_time', 'Not set')}s",
+            
+            # Web Server Configuration
+            f"Web Server Enabled: {web_config.get('enabled', 'Not set')}",
+            f"Web Server Port: {web_config.get('port', 'Not set')}",
+            "=" * 50,
+        ]
+        sys.stdout.write("\n".join(parts) + "\n")
     
     def print_full_config(self):
         """Print the complete loaded configuration in detail"""
-        print("Full Configuration Details:")
-        print("=" * 60)
-        
-        # MQTT Configuration
+        # Build the report first and write it in one go
         mqtt_config = self.get_mqtt_config()
-        print("MQTT Configuration:")
-        print(f"  URL: {mqtt_config.get('url', 'Not set')}")
-        print(f"  Port: {mqtt_config.get('port', 'Not set')}")
-        print(f"  Username: {mqtt_config.get('username', 'Not set')}")
-        print(f"  Password: {'*' * len(mqtt_config.get('password', '')) if mqtt_config.get('password') else 'Not set'}")
-        print(f"  Client ID: {mqtt_config.get('client_id', 'Not set')}")
-        print(f"  Keepalive: {mqtt_config.get('keepalive', 'Not set')}")
-        print(f"  Clean Session: {mqtt_config.get('clean_session', 'Not set')}")
-        
-        # DMX Configuration
         dmx_configs = self.get_dmx_configs()
-        print(f"\nDMX Senders ({len(dmx_configs)}):")
-        for i, config in enumerate(dmx_configs, 1):
-            print(f"  {i}. {config.get('name', 'Unnamed')} ({config.get('type', 'Unknown')})")
-            print(f"     Target: {config.get('target', 'Not set')}")
-            print(f"     Universe: {config.get('universe', 'Not set')}")
-            if config.get('type') == 'e131':
-                print(f"     FPS: {config.get('fps', 'Not set')}")
-            elif config.get('type') == 'artnet':
-                print(f"     Port: {config.get('port', 'Not set')}")
-        
-        # DMX Protocol Settings
-        dmx_settings = self.settings.get("dmx", {})
-        print("\nDMX Protocol Settings:")
-        
-        artnet_config = dmx_settings.get("artnet", {})
-        print("  Art-Net:")
-        print(f"    Default Port: {artnet_config.get('default_port', 'Not set')}")
-        print(f"    Refresh Rate: {artnet_config.get('refresh_rate', 'Not set')}")
-        
-        e131_config = dmx_settings.get("e131", {})
-        print("  E1.31:")
-        print(f"    Default FPS: {e131_config.get('default_fps', 'Not set')}")
-        print(f"    Multicast: {e131_config.get('multicast', 'Not set')}")
-        
-        # Logging Configuration
+        artnet_config = self._dmx.get("artnet", {})
+        e131_config = self._dmx.get("e131", {})
         logging_config = self.get_logging_config()
-        print("\nLogging Configuration:")
-        print(f"  Level: {logging_config.get('level', 'Not set')}")
-        print(f"  Format: {logging_config.get('format', 'Not set')}")
-        
-        # Scenes Configuration
         scenes_config = self.get_scenes_config()
-        print("\nScenes Configuration:")
-        print(f"  Default Transition Time: {scenes_config.get('default_transition_time', 'Not set')}s")
-        print(f"  Auto Send: {scenes_config.get('auto_send', 'Not set')}")
-        
-        # Sequences Configuration
         sequences_config = self.get_sequences_config()
-        print("\nSequences Configuration:")
-        print(f"  Default Duration: {sequences_config.get('default_duration', 'Not set')}s")
-        print(f"  Auto Play: {sequences_config.get('auto_play', 'Not set')}")
         
-        print("=" * 60)
+        parts = [
+            "Full Configuration Details:",
+            "=" * 60,
+            
+            # MQTT Configuration
+            "MQTT Configuration:",
+            f"  URL: {mqtt_config.get('url', 'Not set')}",
+            f"  Port: {mqtt_config.get('port', 'Not set')}",
+            f"  Username: {mqtt_config.get('username', 'Not set')}",
+            f"  Password: {'*' * len(mqtt_config.get('password', '')) if mqtt_config.get('password') else 'Not set'}",
+            f"  Client ID: {mqtt_config.get('client_id', 'Not set')}",
+            f"  Keepalive: {mqtt_config.get('keepalive', 'Not set')}",
+            f"  Clean Session: {mqtt_config.get('clean_session', 'Not set')}",
+            
+            # DMX Configuration
+            f"\nDMX Senders ({len(dmx_configs)}):",
+        ]
+        for i, config in enumerate(dmx_configs, 1):
+            parts.append(f"  {i}. {config.get('name', 'Unnamed')} ({config.get('type', 'Unknown')})")
+            parts.append(f"     Target: {config.get('target', 'Not set')}")
+            parts.append(f"     Universe: {config.get('universe', 'Not set')}")
+            if config.get('type') == 'e131':
+                parts.append(f"     FPS: {config.get('fps', 'Not set')}")
+            elif config.get('type') == 'artnet':
+                parts.append(f"     Port: {config.get('port', 'Not set')}")
+        
+        parts += [
+            # DMX Protocol Settings
+            "\nDMX Protocol Settings:",
+            "  Art-Net:",
+            f"    Default Port: {artnet_config.get('default_port', 'Not set')}",
+            f"    Refresh Rate: {artnet_config.get('refresh_rate', 'Not set')}",
+            "  E1.31:",
+            f"    Default FPS: {e131_config.get('default_fps', 'Not set')}",
+            f"    Multicast: {e131_config.get('multicast', 'Not set')}",
+            
+            # Logging Configuration
+            "\nLogging Configuration:",
+            f"  Level: {logging_config.get('level', 'Not set')}",
+            f"  Format: {logging_config.get('format', 'Not set')}",
+            
+            # Scenes Configuration
+            "\nScenes Configuration:",
+            f"  Default Transition Time: {scenes_config.get('default_transition_time', 'Not set')}s",
+            f"  Auto Send: {scenes_config.get('auto_send', 'Not set')}",
+            
+            # Sequences Configuration
+            "\nSequences Configuration:",
+            f"  Default Duration: {sequences_config.get('default_duration', 'Not set')}s",
+            f"  Auto Play: {sequences_config.get('auto_play', 'Not set')}",
+            "=" * 60,
+        ]
+        sys.stdout.write("\n".join(parts) + "\n")
     
     def print_raw_config(self):
         """Print the raw JSON configuration"""
-        print("Raw Configuration (JSON):")
-        print("=" * 40)
-        print(json.dumps(self.settings, indent=2))
-        print("=" * 40) 
\ No newline at end of file
+        sys.stdout.write("\n".join((
+            "Raw Configuration (JSON):",
+            "=" * 40,
+            json_dumps(self.settings, indent=True).decode('utf-8'),
+            "=" * 40,
+        )) + "\n")
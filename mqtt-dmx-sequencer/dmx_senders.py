@@ -1,11 +1,117 @@
 #!/usr/bin/env python3
+import errno
+import logging
+import socket
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from pyartnet import ArtNetNode
 import sacn
 
+logger = logging.getLogger(__name__)
+
+# Shared all-zero frame used to clear a universe in place
+BLACKOUT_FRAME = bytes(512)
+
+# sACN source port bound by sacn.sACNsender, and the retry schedule used when it is busy
+E131_PORT = 5568
+E131_START_ATTEMPTS = 5
+E131_START_BACKOFF = 0.05
+
+# Upper bound on how long DMXManager.send() waits for a parallel fan-out
+SEND_TIMEOUT = 0.025
+
+
+def parse_channel(channel, value) -> Optional[Tuple[int, int]]:
+    """Coerce a channel/value pair to ints, returning None if it is invalid or out of range"""
+    # Convert string values to integers if needed
+    try:
+        if isinstance(channel, str):
+            channel = int(channel)
+        if isinstance(value, str):
+            value = int(value)
+    except (ValueError, TypeError):
+        print(f"Invalid channel ({channel}) or value ({value})")
+        return None
+    
+    if 1 <= channel <= 512 and 0 <= value <= 255:
+        return channel, value
+    return None
+
+
+def scene_runs(scene_data: List[Any]) -> Optional[List[Tuple[int, bytes]]]:
+    """Split a scene list into (start_channel, bytes) runs of consecutive non-null values
+    
+    Values past channel 512 are dropped. Returns None if any value is not an int in
+    0-255, so the caller can fall back to the validating set_channels() path.
+    """
+    runs = []
+    start = None
+    scene_data = scene_data[:512]
+    try:
+        for index, value in enumerate(scene_data):
+            if value is None:
+                if start is not None:
+                    runs.append((start + 1, bytes(scene_data[start:index])))
+                    start = None
+            elif start is None:
+                start = index
+        if start is not None:
+            runs.append((start + 1, bytes(scene_data[start:])))
+    except (TypeError, ValueError):
+        return None
+    return runs
+
+
+def channel_runs(channels: Dict[int, Any]) -> Optional[List[Tuple[int, bytes]]]:
+    """Group a {channel: value} mapping into (start_channel, bytes) runs of consecutive channels
+    
+    Returns None if any channel is outside 1-512 or any value is not an int in 0-255.
+    """
+    runs = []
+    start = previous = None
+    values = []
+    try:
+        for channel in sorted(channels):
+            if not 1 <= channel <= 512:
+                return None
+            if previous is not None and channel != previous + 1:
+                runs.append((start, bytes(values)))
+                values = []
+                start = None
+            if start is None:
+                start = channel
+            values.append(channels[channel])
+            previous = channel
+        if start is not None:
+            runs.append((start, bytes(values)))
+    except (TypeError, ValueError):
+        return None
+    return runs
+
+
+def parse_channels(channels: Dict[Any, Any]) -> Dict[int, int]:
+    """Coerce a {channel: value} mapping to ints, dropping invalid or out-of-range entries"""
+    parsed = {}
+    for channel, value in channels.items():
+        # Convert string values to integers if needed
+        try:
+            if isinstance(channel, str):
+                channel = int(channel)
+            if isinstance(value, str):
+                value = int(value)
+        except (ValueError, TypeError):
+            print(f"Invalid channel ({channel}) or value ({value})")
+            continue
+        
+        if 1 <= channel <= 512 and 0 <= value <= 255:
+            parsed[channel] = value
+        else:
+            print(f"Channel {channel} or value {value} out of range (1-512, 0-255)")
+    return parsed
+
 
 class DMXSender(ABC):
     """Abstract base class for DMX senders"""
@@ -13,8 +119,12 @@ class DMXSender(ABC):
     def __init__(self, universe_id: int = 1, test_mode: bool = False):
         self.universe_id = universe_id
         self.lock = threading.Lock()
-        self.universe_data = [0] * 512
+        self.universe_data = bytearray(512)
+        # Set whenever universe_data changes; senders skip pushing unchanged frames
+        self._dirty = True
         self._active = False
+        # Only warn once about sends while inactive; reset when a start succeeds
+        self._warned_inactive = False
         self.test_mode = test_mode
     
     @abstractmethod
@@ -28,55 +138,85 @@ class DMXSender(ABC):
         pass
     
     @abstractmethod
-    def send(self):
-        """Send the current universe data"""
+    def send(self, force: bool = False):
+        """Send the current universe data, even if it is unchanged when force is set"""
         pass
     
     def set_channel(self, channel: int, value: int):
         """Set a specific channel value"""
-        # Convert string values to integers if needed
-        try:
-            if isinstance(channel, str):
-                channel = int(channel)
-            if isinstance(value, str):
-                value = int(value)
-        except (ValueError, TypeError):
-            print(f"Invalid channel ({channel}) or value ({value})")
-            return
-        
-        with self.lock:
-            if 1 <= channel <= 512 and 0 <= value <= 255:
-                self.universe_data[channel - 1] = value
+        parsed = parse_channel(channel, value)
+        if parsed:
+            self.set_channel_fast(*parsed)
     
     def set_channels(self, channels: Dict[int, int]):
         """Set multiple channels at once"""
+        # Validate before taking the lock so it is only held for the buffer writes
+        self.set_channels_fast(parse_channels(channels))
+    
+    def set_channel_fast(self, channel: int, value: int):
+        """Set a channel from ints already validated as 1-512 / 0-255
+        
+        The index and value are masked rather than range-checked, so out-of-range
+        input wraps instead of raising; callers are expected to pre-filter.
+        """
+        with self.lock:
+            self.universe_data[(channel - 1) & 511] = value & 0xFF
+            self._dirty = True
+    
+    def set_channels_fast(self, channels: Dict[int, int]):
+        """Set multiple channels from a mapping already validated by parse_channels
+        
+        Uses the same masking as set_channel_fast().
+        """
         with self.lock:
+            universe_data = self.universe_data
             for channel, value in channels.items():
-                # Convert string values to integers if needed
-                try:
-                    if isinstance(channel, str):
-                        channel = int(channel)
-                    if isinstance(value, str):
-                        value = int(value)
-                except (ValueError, TypeError):
-                    print(f"Invalid channel ({channel}) or value ({value})")
-                    continue
-                
-                if 1 <= channel <= 512 and 0 <= value <= 255:
-                    self.universe_data[channel - 1] = value
-                else:
-                    print(f"Channel {channel} or value {value} out of range (1-512, 0-255)")
+                universe_data[(channel - 1) & 511] = value & 0xFF
+            if channels:
+                self._dirty = True
+    
+    def set_slice(self, start_channel: int, payload: bytes):
+        """Copy raw DMX bytes into the universe starting at start_channel
+        
+        Data running past channel 512 is truncated.
+        """
+        offset = start_channel - 1
+        if not 0 <= offset < 512:
+            print(f"Start channel {start_channel} out of range (1-512)")
+            return
+        data = memoryview(payload)[:512 - offset]
+        with self.lock:
+            self.universe_data[offset:offset + len(data)] = data
+            if data:
+                self._dirty = True
+    
+    def set_runs(self, runs: List[Tuple[int, bytes]]):
+        """Copy several (start_channel, bytes) runs into the universe under one lock
+        
+        Runs must already lie within channels 1-512, e.g. as built by scene_runs().
+        """
+        with self.lock:
+            universe_data = self.universe_data
+            for start_channel, payload in runs:
+                universe_data[start_channel - 1:start_channel - 1 + len(payload)] = payload
+            if runs:
+                self._dirty = True
     
     def blackout(self):
         """Set all channels to 0"""
         with self.lock:
-            self.universe_data = [0] * 512
+            self.universe_data[:] = BLACKOUT_FRAME
+            self._dirty = True
         self.send()
     
-    def get_universe_data(self) -> List[int]:
-        """Get current universe data"""
-        with self.lock:
-            return self.universe_data.copy()
+    def get_universe_data(self) -> bytes:
+        """Get an immutable snapshot of the current universe data"""
+        # bytes() copies the buffer in one C call under the GIL, no lock needed
+        return bytes(self.universe_data)
+    
+    def get_universe_list(self) -> List[int]:
+        """Get current universe data as a list of ints"""
+        return list(self.get_universe_data())
     
     @property
     def active(self) -> bool:
@@ -101,6 +241,9 @@ class ArtNetSender(DMXSender):
             self.universe = self.node.add_universe(self.universe_id)
             self.channel = self.universe.add_channel(start=1, width=512)
             self.node.start()
+            # A fresh node has no frame yet, so push the buffer on the next send
+            self._dirty = True
+            self._warned_inactive = False
             self._active = True
             print(f"Art-Net sender started - Target: {self.target_ip}:{self.port}, Universe: {self.universe_id}")
         except Exception as e:
@@ -117,17 +260,26 @@ class ArtNetSender(DMXSender):
             except Exception as e:
                 print(f"Error stopping Art-Net sender: {e}")
     
-    def send(self):
+    def send(self, force: bool = False):
         """Send current universe data via Art-Net"""
         if self._active and self.channel:
             with self.lock:
+                # pyartnet keeps refreshing the last frame on its own; force re-pushes it
+                # for DMX retransmission
+                if not (self._dirty or force):
+                    return
                 try:
-                    print(f"Art-Net sending universe {self.universe_id} data: {self.universe_data[:10]}... (first 10 channels)")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Art-Net sending universe %d data: %s... (first 10 channels)",
+                                     self.universe_id, list(self.universe_data[:10]))
                     self.channel.add_fade(self.universe_data, 0)  # 0ms fade
+                    self._dirty = False
                 except Exception as e:
                     print(f"Error sending Art-Net data: {e}")
-        else:
-            print(f"Art-Net sender not active or not initialized. Active: {self._active}, Channel: {self.channel is not None}")
+        elif not self._warned_inactive:
+            self._warned_inactive = True
+            logger.warning("Art-Net sender not active or not initialized. Active: %s, Channel: %s",
+                           self._active, self.channel is not None)
 
 
 class TestSender(DMXSender):
@@ -148,16 +300,33 @@ class TestSender(DMXSender):
         self._active = False
         print(f"Test DMX sender stopped - Universe: {self.universe_id}")
     
-    def send(self):
+    def send(self, force: bool = False):
         """Print current universe data"""
-        if self._active:
-            with self.lock:
-                # Find non-zero channels
-                active_channels = {i+1: val for i, val in enumerate(self.universe_data) if val > 0}
-                if active_channels:
-                    print(f"TEST DMX - Universe {self.universe_id} - Active channels: {active_channels}")
-                else:
-                    print(f"TEST DMX - Universe {self.universe_id} - All channels at 0")
+        if self._active and logger.isEnabledFor(logging.INFO):
+            data = self.get_universe_data()
+            if data == BLACKOUT_FRAME:
+                logger.info("TEST DMX - Universe %d - All channels at 0", self.universe_id)
+                return
+            # lstrip/rstrip find the non-zero window in C; only that slice is walked
+            start = len(data) - len(data.lstrip(b"\x00"))
+            end = len(data.rstrip(b"\x00"))
+            active_channels = {i + 1: data[i] for i in range(start, end) if data[i]}
+            logger.info("TEST DMX - Universe %d - Active channels: %s", self.universe_id, active_channels)
+
+
+def e131_port_available(bind_address: str = '0.0.0.0', port: int = E131_PORT) -> bool:
+    """Cheaply check that the sACN port can be bound, the same way sacn binds it"""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        probe.bind((bind_address, port))
+        return True
+    except OSError as e:
+        if e.errno == errno.EADDRINUSE:
+            return False
+        raise
+    finally:
+        probe.close()
 
 
 class E131Sender(DMXSender):
@@ -179,21 +348,30 @@ class E131Sender(DMXSender):
                 except:
                     pass
             
-            # Try different ports if the default one is in use
-            for attempt in range(3):
+            # Retry with exponential backoff (50ms, 100ms, ...) while the port is busy
+            for attempt in range(E131_START_ATTEMPTS):
+                last_attempt = attempt == E131_START_ATTEMPTS - 1
+                # Probe the port first so we don't build a full sender just to fail
+                if not last_attempt and not e131_port_available():
+                    print(f"Port conflict, retrying... (attempt {attempt + 1})")
+                    time.sleep(E131_START_BACKOFF * (2 ** attempt))
+                    continue
                 try:
                     self.sender = sacn.sACNsender(fps=self.fps)
                     self.sender.start()
                     self.sender.activate_output(self.universe_id)
                     self.sender[self.universe_id].multicast = True
                     self.sender[self.universe_id].destination = self.target_ip
+                    # A fresh sender has no frame yet, so push the buffer on the next send
+                    self._dirty = True
+                    self._warned_inactive = False
                     self._active = True
                     print(f"E1.31 sender started - Target: {self.target_ip}, Universe: {self.universe_id}, FPS: {self.fps}")
                     break
                 except OSError as e:
-                    if "Address already in use" in str(e) and attempt < 2:
+                    if e.errno == errno.EADDRINUSE and not last_attempt:
                         print(f"Port conflict, retrying... (attempt {attempt + 1})")
-                        time.sleep(1)
+                        time.sleep(E131_START_BACKOFF * (2 ** attempt))
                         continue
                     else:
                         raise e
@@ -211,25 +389,50 @@ class E131Sender(DMXSender):
             except Exception as e:
                 print(f"Error stopping E1.31 sender: {e}")
     
-    def send(self):
+    def send(self, force: bool = False):
         """Send current universe data via E1.31"""
         if self._active and self.sender:
             with self.lock:
+                # sacn's own thread keeps transmitting the last frame at fps; force
+                # re-pushes it for DMX retransmission
+                if not (self._dirty or force):
+                    return
                 try:
-                    print(f"E1.31 sending universe {self.universe_id} data: {self.universe_data[:10]}... (first 10 channels)")
-                    self.sender[self.universe_id].dmx_data = self.universe_data
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("E1.31 sending universe %d data: %s... (first 10 channels)",
+                                     self.universe_id, list(self.universe_data[:10]))
+                    # sacn validates and copies whatever it is given into its own
+                    # tuple, so hand it an immutable snapshot rather than our buffer
+                    self.sender[self.universe_id].dmx_data = bytes(self.universe_data)
+                    self._dirty = False
                 except Exception as e:
                     print(f"Error sending E1.31 data: {e}")
-        else:
-            print(f"E1.31 sender not active or not initialized. Active: {self._active}, Sender: {self.sender is not None}")
+        elif not self._warned_inactive:
+            self._warned_inactive = True
+            logger.warning("E1.31 sender not active or not initialized. Active: %s, Sender: %s",
+                           self._active, self.sender is not None)
 
 
 class DMXManager:
     """Manager for multiple DMX senders"""
     
     def __init__(self):
+        # Copy-on-write: writers rebind a new dict under the lock, readers use
+        # whatever dict is bound at the time without locking
         self.senders: Dict[str, DMXSender] = {}
         self.lock = threading.Lock()
+        # Persistent pool so sends to several senders go out in parallel
+        self._pool: Optional[ThreadPoolExecutor] = None
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Return the send pool, creating it on first use"""
+        pool = self._pool
+        if pool is None:
+            with self.lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dmx-send")
+                pool = self._pool
+        return pool
     
     def add_sender(self, name: str, sender: DMXSender) -> bool:
         """Add a DMX sender with a unique name"""
@@ -238,7 +441,9 @@ class DMXManager:
                 print(f"Sender '{name}' already exists")
                 return False
             
-            self.senders[name] = sender
+            senders = dict(self.senders)
+            senders[name] = sender
+            self.senders = senders
             sender.start()
             
             # Check if the sender is actually active after starting
@@ -255,118 +460,143 @@ class DMXManager:
                 print(f"Sender '{name}' not found")
                 return False
             
-            sender = self.senders[name]
-            sender.stop()
-            del self.senders[name]
-            return True
+            senders = dict(self.senders)
+            sender = senders.pop(name)
+            self.senders = senders
+        sender.stop()
+        return True
     
     def get_sender(self, name: str) -> DMXSender:
         """Get a DMX sender by name"""
-        with self.lock:
-            return self.senders.get(name)
+        return self.senders.get(name)
     
     def list_senders(self) -> List[str]:
         """List all sender names"""
-        with self.lock:
-            return list(self.senders.keys())
+        return list(self.senders)
     
     def set_channel(self, channel: int, value: int, sender_name: str = None):
         """Set a channel on specific sender or all senders"""
-        # Convert string values to integers if needed
-        try:
-            if isinstance(channel, str):
-                channel = int(channel)
-            if isinstance(value, str):
-                value = int(value)
-        except (ValueError, TypeError):
-            print(f"Invalid channel ({channel}) or value ({value})")
+        # Convert once here; senders then take the typed fast path
+        parsed = parse_channel(channel, value)
+        if not parsed:
             return
+        channel, value = parsed
         
-        with self.lock:
-            if sender_name:
-                if sender_name in self.senders:
-                    self.senders[sender_name].set_channel(channel, value)
-                else:
-                    print(f"Sender '{sender_name}' not found")
+        senders = self.senders
+        if sender_name:
+            if sender_name in senders:
+                senders[sender_name].set_channel_fast(channel, value)
             else:
-                # Set on all active senders
-                for sender in self.senders.values():
-                    if sender.active:
-                        sender.set_channel(channel, value)
+                print(f"Sender '{sender_name}' not found")
+        else:
+            # Set on all active senders
+            for sender in senders.values():
+                if sender.active:
+                    sender.set_channel_fast(channel, value)
     
     def set_channels(self, channels: Dict[int, int], sender_name: str = None):
         """Set multiple channels on specific sender or all senders"""
-        # Convert string keys to integers if needed
-        dmx_channels = {}
-        for channel_key, value in channels.items():
-            try:
-                if isinstance(channel_key, str):
-                    channel = int(channel_key)
-                else:
-                    channel = channel_key
-                dmx_channels[channel] = value
-            except (ValueError, TypeError):
-                print(f"Invalid channel number: {channel_key}")
-                continue
+        # Convert once here; senders then take the typed fast path
+        dmx_channels = parse_channels(channels)
         
-        with self.lock:
-            if sender_name:
-                if sender_name in self.senders:
-                    self.senders[sender_name].set_channels(dmx_channels)
-                else:
-                    print(f"Sender '{sender_name}' not found")
+        senders = self.senders
+        if sender_name:
+            if sender_name in senders:
+                senders[sender_name].set_channels_fast(dmx_channels)
+            else:
+                print(f"Sender '{sender_name}' not found")
+        else:
+            # Set on all active senders
+            for sender in senders.values():
+                if sender.active:
+                    sender.set_channels_fast(dmx_channels)
+    
+    def set_slice(self, start_channel: int, payload: bytes, sender_name: str = None):
+        """Copy raw DMX bytes starting at start_channel on specific sender or all senders"""
+        senders = self.senders
+        if sender_name:
+            if sender_name in senders:
+                senders[sender_name].set_slice(start_channel, payload)
             else:
-                # Set on all active senders
-                for sender in self.senders.values():
-                    if sender.active:
-                        sender.set_channels(dmx_channels)
+                print(f"Sender '{sender_name}' not found")
+        else:
+            # Set on all active senders
+            for sender in senders.values():
+                if sender.active:
+                    sender.set_slice(start_channel, payload)
+    
+    def set_runs(self, runs: List[Tuple[int, bytes]], sender_name: str = None):
+        """Copy pre-built (start_channel, bytes) runs on specific sender or all senders"""
+        senders = self.senders
+        if sender_name:
+            if sender_name in senders:
+                senders[sender_name].set_runs(runs)
+            else:
+                print(f"Sender '{sender_name}' not found")
+        else:
+            # Set on all active senders
+            for sender in senders.values():
+                if sender.active:
+                    sender.set_runs(runs)
     
-    def send(self, sender_name: str = None):
-        """Send data on specific sender or all senders"""
-        with self.lock:
-            if sender_name:
-                if sender_name in self.senders:
-                    print(f"Sending DMX data via sender: {sender_name}")
-                    self.senders[sender_name].send()
-                else:
-                    print(f"Sender '{sender_name}' not found")
+    def send(self, sender_name: str = None, force: bool = False):
+        """Send data on specific sender or all senders
+        
+        Senders skip frames that haven't changed since their last send unless force is set.
+        """
+        senders = self.senders
+        if sender_name:
+            if sender_name in senders:
+                logger.debug("Sending DMX data via sender: %s", sender_name)
+                senders[sender_name].send(force)
             else:
-                # Send on all active senders
-                active_senders = [name for name, sender in self.senders.items() if sender.active]
-                print(f"Sending DMX data via {len(active_senders)} active senders: {active_senders}")
-                for sender in self.senders.values():
-                    if sender.active:
-                        sender.send()
+                print(f"Sender '{sender_name}' not found")
+        else:
+            # Send on all active senders
+            if logger.isEnabledFor(logging.DEBUG):
+                active_senders = [name for name, sender in senders.items() if sender.active]
+                logger.debug("Sending DMX data via %d active senders: %s", len(active_senders), active_senders)
+            active = [sender for sender in senders.values() if sender.active]
+            if len(active) == 1:
+                active[0].send(force)
+            elif active:
+                # Each send is UDP I/O, so fan out and wait for the slowest one
+                pool = self._get_pool()
+                wait([pool.submit(sender.send, force) for sender in active], timeout=SEND_TIMEOUT)
     
     def blackout(self, sender_name: str = None):
         """Blackout specific sender or all senders"""
-        with self.lock:
-            if sender_name:
-                if sender_name in self.senders:
-                    self.senders[sender_name].blackout()
-                else:
-                    print(f"Sender '{sender_name}' not found")
+        senders = self.senders
+        if sender_name:
+            if sender_name in senders:
+                senders[sender_name].blackout()
             else:
-                # Blackout all active senders
-                for sender in self.senders.values():
-                    if sender.active:
-                        sender.blackout()
+                print(f"Sender '{sender_name}' not found")
+        else:
+            # Blackout all active senders
+            for sender in senders.values():
+                if sender.active:
+                    sender.blackout()
     
     def stop_all(self):
         """Stop all senders"""
         with self.lock:
-            for name, sender in self.senders.items():
-                sender.stop()
-            self.senders.clear()
+            senders = self.senders
+            self.senders = {}
+            pool = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        for name, sender in senders.items():
+            sender.stop()
     
     def get_status(self) -> Dict[str, Any]:
         """Get status of all senders"""
-        with self.lock:
-            status = {}
-            for name, sender in self.senders.items():
-                status[name] = {
-                    'active': sender.active,
-                    'universe': sender.universe_id,
-                    'type': sender.__class__.__name__
-                }
-            return status 
\ No newline at end of file
+        status = {}
+        for name, sender in self.senders.items():
+            status[name] = {
+                'active': sender.active,
+                'universe': sender.universe_id,
+                'type': sender.__class__.__name__
+            }
+        return status
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+DMX value checks shared by the sequencer's embedded API and the standalone Flask server
+"""
+
+from typing import Optional
+
+
+def is_dmx_value(value) -> bool:
+    """Check that value is an int in 0-255"""
+    # value | (255 - value) has bits above the low 8 set (or goes negative) only when out of range
+    return isinstance(value, int) and not (value | (255 - value)) >> 8
+
+
+def is_dmx_channel(channel: int) -> bool:
+    """Check that an int channel number is in 1-512"""
+    # Same trick: both terms fit in 9 bits only when 1 <= channel <= 512
+    return not ((channel - 1) | (512 - channel)) >> 9
+
+
+def are_dmx_values(values) -> bool:
+    """Check that every value is an int in 0-255 with a single C-level pass"""
+    try:
+        bytes(values)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def validate_scene_channels(channels) -> Optional[str]:
+    """Validate a scene's channel list, returning an error message or None if it is valid"""
+    if not isinstance(channels, list):
+        return "Channels must be a list"
+
+    # Fast path: bytes() range- and type-checks every value in one C loop
+    if are_dmx_values(channels if None not in channels else [v for v in channels if v is not None]):
+        return None
+
+    # Slow path only to report which channel is bad
+    for i, value in enumerate(channels):
+        if value is not None and not is_dmx_value(value):
+            return f"Channel {i+1} value must be null or 0-255, got {value}"
+    return None
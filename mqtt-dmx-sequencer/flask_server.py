@@ -4,21 +4,37 @@ Flask API Server for MQTT DMX Sequencer
 Provides REST API endpoints to manage scenes and sequences
 """
 
-from flask import Flask, request, jsonify, send_from_directory
-import json
+from flask import Flask, Response, request, send_from_directory
 import os
-from typing import Dict, Any, List
-from config_manager import ConfigManager
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+from config_manager import ConfigManager, DebouncedJSONWriter, json_loads, json_dumps
+from dmx_validation import is_dmx_value, is_dmx_channel, are_dmx_values, validate_scene_channels
+from json_provider import install_json_provider
 
 app = Flask(__name__, static_folder='static')
+install_json_provider(app)
 
 # Global config manager instance
 config_manager = None
 config_path = None
 
+# Authoritative scenes/sequences, written back through a debounced writer and
+# re-read only when another process changes config.json
+_state = None
+_state_lock = threading.RLock()
+_config_writer = None
+# Scene/sequence edits that may not be on disk yet, re-applied after a re-read:
+# (kind, name) -> (edit number, value or _DELETED)
+_pending_edits: Dict[Tuple[str, str], Tuple[int, Any]] = {}
+_edit_count = 0
+_DELETED = object()
+# (kind, name) -> (value, encoded JSON); reused while the stored value is the same object
+_encoded_entries: Dict[Tuple[str, str], Tuple[Any, bytes]] = {}
+
 def load_config_files(config_dir: str = None):
     """Load configuration files"""
-    global config_manager, config_path
+    global config_manager, config_path, _state, _config_writer
     
     if config_dir is None:
         # Default to current directory
@@ -28,85 +44,278 @@ def load_config_files(config_dir: str = None):
     config_path = os.path.join(config_dir, 'config.json')
     
     config_manager = ConfigManager(settings_path)
+    
+    with _state_lock:
+        if _config_writer is not None:
+            _config_writer.flush()
+        _config_writer = DebouncedJSONWriter(config_path, on_conflict=merge_external_changes)
+        _state = read_config_file()
+        _encoded_entries.clear()
+        _pending_edits.clear()
     return config_path
 
-def load_scenes_and_sequences() -> Dict[str, Any]:
-    """Load scenes and sequences from config file"""
+def read_config_file() -> Dict[str, Any]:
+    """Parse scenes and sequences from the config file on disk"""
+    # Taken before reading so a write racing the read is picked up on the next access
+    _config_writer.mtime = _config_writer.file_mtime()
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            return json_loads(f.read())
     except FileNotFoundError:
         return {"scenes": {}, "sequences": {}}
-    except json.JSONDecodeError:
+    except ValueError:
+        # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
         return {"scenes": {}, "sequences": {}}
 
-def save_scenes_and_sequences(data: Dict[str, Any]) -> bool:
-    """Save scenes and sequences to config file"""
-    try:
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(config_path), exist_ok=True)
-        
-        with open(config_path, 'w') as f:
-            json.dump(data, f, indent=2)
-        return True
-    except Exception as e:
-        print(f"Error saving configuration: {e}")
-        return False
+def load_scenes_and_sequences() -> Dict[str, Any]:
+    """Return the in-memory scenes and sequences"""
+    if _state is None:
+        load_config_files()
+    return _state
+
+def merge_external_changes():
+    """Re-read config.json after another process wrote it and re-apply our unwritten edits"""
+    global _state
+    with _state_lock:
+        written = _config_writer.written_tag or 0
+        _state = read_config_file()
+        _encoded_entries.clear()
+        for key, (number, value) in list(_pending_edits.items()):
+            if number <= written:
+                # Already in a file the other process has since replaced; its version wins
+                del _pending_edits[key]
+                continue
+            kind, name = key
+            entries = _state.setdefault(kind, {})
+            if value is _DELETED:
+                entries.pop(name, None)
+            else:
+                entries[name] = value
+        if _pending_edits:
+            _config_writer.schedule(_state, _edit_count)
+
+@app.before_request
+def sync_config_file():
+    """Pick up changes another process (e.g. the sequencer's own API) made to config.json"""
+    # Once per API request, so the per-entry helpers never stat the file
+    if not request.path.startswith('/api/'):
+        return
+    if _state is None:
+        load_config_files()
+    if _config_writer.file_mtime() != _config_writer.mtime:
+        merge_external_changes()
+
+def schedule_save(kind: str, name: str, value: Any):
+    """Record an edit and schedule writing the in-memory state, call with _state_lock held"""
+    global _edit_count
+    _edit_count += 1
+    _pending_edits[(kind, name)] = (_edit_count, value)
+    # Surfaces as the route's 500 error body, like a failed save did before debouncing
+    if not _config_writer.schedule(_state, _edit_count):
+        raise RuntimeError("Failed to save configuration")
+
+def put_config_entry(kind: str, name: str, value: Any, create: bool = True,
+                     encoded: Optional[bytes] = None) -> bool:
+    """Set a scene or sequence in memory and schedule a save
+    
+    Returns False without changing anything if create is False and the entry does not exist.
+    encoded may carry the value's JSON encoding so later reads don't encode it again.
+    Raises RuntimeError if the configuration can't be saved.
+    """
+    with _state_lock:
+        entries = load_scenes_and_sequences().setdefault(kind, {})
+        if not create and name not in entries:
+            return False
+        entries[name] = value
+        if encoded is not None:
+            _encoded_entries[(kind, name)] = (value, encoded)
+        schedule_save(kind, name, value)
+    return True
+
+def pop_config_entry(kind: str, name: str) -> Any:
+    """Remove a scene or sequence from memory and schedule a save, returns None if it did not exist
+    
+    Raises RuntimeError if the configuration can't be saved.
+    """
+    with _state_lock:
+        entries = load_scenes_and_sequences().get(kind, {})
+        if name not in entries:
+            return None
+        value = entries.pop(name)
+        _encoded_entries.pop((kind, name), None)
+        schedule_save(kind, name, _DELETED)
+    return value
+
+def encode_entry(kind: str, name: str, value: Any) -> bytes:
+    """Return the JSON encoding of a stored scene or sequence, cached per entry"""
+    cached = _encoded_entries.get((kind, name))
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    encoded = json_dumps(value)
+    with _state_lock:
+        # The entry may have been replaced or removed while it was encoded; only cache what is still stored
+        if load_scenes_and_sequences().get(kind, {}).get(name) is value:
+            _encoded_entries[(kind, name)] = (value, encoded)
+    return encoded
+
+# Canonical string keys for channels 1-512, as they appear in sequence step JSON
+VALID_CHANNEL_KEYS = frozenset(map(str, range(1, 513)))
+
+def validate_and_pack_steps(steps) -> Tuple[Optional[bytes], Optional[str]]:
+    """Validate sequence steps and encode them once, returning (encoded, None) or (None, error)
+    
+    The encoding is reused for the response and for later listings of the sequence.
+    """
+    error = validate_sequence_steps(steps)
+    if error:
+        return None, error
+    return json_dumps(steps), None
+
+def validate_sequence_steps(steps) -> Optional[str]:
+    """Validate sequence steps, returning an error message or None if they are valid"""
+    if not isinstance(steps, list):
+        return "Steps must be a list"
+    
+    for i, step in enumerate(steps, 1):
+        if not isinstance(step, dict):
+            return f"Step {i} must be an object"
+        if 'dmx' not in step:
+            return f"Step {i} missing required field: dmx"
+        if 'duration' not in step:
+            return f"Step {i} missing required field: duration"
+        
+        # Validate DMX data
+        dmx_data = step['dmx']
+        if not isinstance(dmx_data, dict):
+            return f"Step {i} dmx field must be an object"
+        
+        # Fast path: canonical channel keys checked with one set comparison, values in C via bytes();
+        # the slow path handles keys like "05" and reports which entry is bad
+        if not (dmx_data.keys() <= VALID_CHANNEL_KEYS and are_dmx_values(dmx_data.values())):
+            for channel, value in dmx_data.items():
+                # isdecimal() is a plain C scan; only odd keys like " 7" fall through to try/int()
+                if channel.isdecimal():
+                    channel_num = int(channel)
+                else:
+                    try:
+                        channel_num = int(channel)
+                    except ValueError:
+                        return f"Step {i} channel {channel} must be a number"
+                if not is_dmx_channel(channel_num):
+                    return f"Step {i} channel {channel} must be 1-512"
+                if not is_dmx_value(value):
+                    return f"Step {i} channel {channel} value must be 0-255"
+        
+        # Validate duration
+        try:
+            duration = float(step['duration'])
+        except (ValueError, TypeError):
+            return f"Step {i} duration must be a number"
+        if duration < 0:
+            return f"Step {i} duration must be non-negative"
+    return None
 
 # Web Interface Routes
 
+# Browser cache lifetime for static assets when web_server.static_max_age isn't set, same
+# as the sequencer's own server. They are not fingerprinted, so keep it short;
+# index.html is always revalidated (ETag/Last-Modified give a cheap 304)
+DEFAULT_STATIC_MAX_AGE = 300
+
+def static_max_age() -> int:
+    """Browser cache lifetime for static assets, none in debug mode"""
+    if app.debug:
+        return 0
+    if config_manager is None:
+        load_config_files()
+    return config_manager.get_web_server_config().get('static_max_age', DEFAULT_STATIC_MAX_AGE)
+
 @app.route('/')
 def index():
     """Serve the main web interface"""
-    return send_from_directory('static', 'index.html')
+    return send_from_directory('static', 'index.html', conditional=True, max_age=0)
 
 @app.route('/<path:filename>')
 def static_files(filename):
     """Serve static files"""
-    return send_from_directory('static', filename)
+    return send_from_directory('static', filename, conditional=True, max_age=static_max_age())
 
 # API Routes
 
+def json_response(payload: Any, status: int = 200) -> Response:
+    """Encode payload straight into a JSON response, skipping jsonify"""
+    return Response(json_dumps(payload), status=status, mimetype='application/json')
+
+# Health check body never changes, so encode it once
+_HEALTH_BODY = json_dumps({
+    "status": "healthy",
+    "service": "mqtt-dmx-sequencer-api",
+    "version": "1.0.0"
+})
+
+def entry_saved_response(message: str, name: str, field: str, encoded: bytes, status: int = 200) -> Response:
+    """Build a success response for a saved entry around its already-encoded value"""
+    body = b''.join((
+        b'{"success":true,"message":', json_dumps(message),
+        b',"data":{"name":', json_dumps(name),
+        b',"', field.encode(), b'":', encoded, b'}}'
+    ))
+    return Response(body, status=status, mimetype='application/json')
+
+# Pre-encoded pieces of the {"success": true, "data": ..., "count": N} envelope
+_OK_PREFIX = b'{"success":true,"data":'
+_COUNT_PREFIX = b',"count":'
+
+def ok_response(data: Any, count: Optional[int] = None) -> Response:
+    """Build a success response by wrapping the encoded data in the pre-encoded envelope"""
+    parts = [_OK_PREFIX, json_dumps(data)]
+    if count is not None:
+        parts += (_COUNT_PREFIX, str(count).encode())
+    parts.append(b'}')
+    return Response(b''.join(parts), mimetype='application/json')
+
+def entries_ok_response(kind: str) -> Response:
+    """Build a success response listing all scenes or sequences, including the count"""
+    # Snapshot the items so concurrent edits can't break iteration while encoding
+    with _state_lock:
+        items = list(load_scenes_and_sequences().get(kind, {}).items())
+    
+    # Encoded before the response exists, so a failure still becomes the route's 500 error body
+    parts = [b'{"success":true,"count":', str(len(items)).encode(), b',"data":{']
+    separator = b''
+    for name, value in items:
+        parts += (separator, json_dumps(name), b':', encode_entry(kind, name, value))
+        separator = b','
+    parts.append(b'}}')
+    return Response(b''.join(parts), mimetype='application/json')
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "mqtt-dmx-sequencer-api",
-        "version": "1.0.0"
-    })
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get current configuration"""
     try:
         config = load_scenes_and_sequences()
-        return jsonify({
-            "success": True,
-            "data": config
-        })
+        return ok_response(config)
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/scenes', methods=['GET'])
 def get_scenes():
     """Get all scenes"""
     try:
-        config = load_scenes_and_sequences()
-        scenes = config.get('scenes', {})
-        return jsonify({
-            "success": True,
-            "data": scenes,
-            "count": len(scenes)
-        })
+        return entries_ok_response('scenes')
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/scenes/<scene_name>', methods=['GET'])
 def get_scene(scene_name: str):
@@ -116,12 +325,12 @@ def get_scene(scene_name: str):
         scenes = config.get('scenes', {})
         
         if scene_name not in scenes:
-            return jsonify({
+            return json_response({
                 "success": False,
                 "error": f"Scene '{scene_name}' not found"
-            }), 404
+            }, 404)
         
-        return jsonify({
+        return json_response({
             "success": True,
             "data": {
                 "name": scene_name,
@@ -129,10 +338,10 @@ def get_scene(scene_name: str):
             }
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/scenes', methods=['POST'])
 def create_scene():
@@ -141,52 +350,37 @@ def create_scene():
         data = request.get_json()
         
         if not data or 'name' not in data or 'channels' not in data:
-            return jsonify({
+            return json_response({
                 "success": False,
                 "error": "Missing required fields: name and channels"
-            }), 400
+            }, 400)
         
         scene_name = data['name']
         channels = data['channels']
         
         # Validate channels
-        if not isinstance(channels, list):
-            return jsonify({
+        error = validate_scene_channels(channels)
+        if error:
+            return json_response({
                 "success": False,
-                "error": "Channels must be a list"
-            }), 400
-        
-        # Validate channel values
-        for i, value in enumerate(channels):
-            if value is not None and (not isinstance(value, int) or value < 0 or value > 255):
-                return jsonify({
-                    "success": False,
-                    "error": f"Channel {i+1} value must be null or 0-255, got {value}"
-                }), 400
+                "error": error
+            }, 400)
         
-        config = load_scenes_and_sequences()
-        config['scenes'][scene_name] = channels
-        
-        if save_scenes_and_sequences(config):
-            return jsonify({
-                "success": True,
-                "message": f"Scene '{scene_name}' created successfully",
-                "data": {
-                    "name": scene_name,
-                    "channels": channels
-                }
-            }), 201
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to save configuration"
-            }), 500
+        put_config_entry('scenes', scene_name, channels)
+        return json_response({
+            "success": True,
+            "message": f"Scene '{scene_name}' created successfully",
+            "data": {
+                "name": scene_name,
+                "channels": channels
+            }
+        }, 201)
             
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/scenes/<scene_name>', methods=['PUT'])
 def update_scene(scene_name: str):
@@ -195,110 +389,79 @@ def update_scene(scene_name: str):
         data = request.get_json()
         
         if not data or 'channels' not in data:
-            return jsonify({
+            return json_response({
                 "success": False,
                 "error": "Missing required field: channels"
-            }), 400
+            }, 400)
         
         channels = data['channels']
         
         # Validate channels
-        if not isinstance(channels, list):
-            return jsonify({
+        error = validate_scene_channels(channels)
+        if error:
+            return json_response({
                 "success": False,
-                "error": "Channels must be a list"
-            }), 400
+                "error": error
+            }, 400)
         
-        # Validate channel values
-        for i, value in enumerate(channels):
-            if value is not None and (not isinstance(value, int) or value < 0 or value > 255):
-                return jsonify({
-                    "success": False,
-                    "error": f"Channel {i+1} value must be null or 0-255, got {value}"
-                }), 400
-        
-        config = load_scenes_and_sequences()
-        
-        if scene_name not in config.get('scenes', {}):
-            return jsonify({
+        if not put_config_entry('scenes', scene_name, channels, create=False):
+            return json_response({
                 "success": False,
                 "error": f"Scene '{scene_name}' not found"
-            }), 404
-        
-        config['scenes'][scene_name] = channels
-        
-        if save_scenes_and_sequences(config):
-            return jsonify({
-                "success": True,
-                "message": f"Scene '{scene_name}' updated successfully",
-                "data": {
-                    "name": scene_name,
-                    "channels": channels
-                }
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to save configuration"
-            }), 500
+            }, 404)
+        
+        return json_response({
+            "success": True,
+            "message": f"Scene '{scene_name}' updated successfully",
+            "data": {
+                "name": scene_name,
+                "channels": channels
+            }
+        })
             
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/scenes/<scene_name>', methods=['DELETE'])
 def delete_scene(scene_name: str):
     """Delete a scene"""
     try:
-        config = load_scenes_and_sequences()
+        deleted_channels = pop_config_entry('scenes', scene_name)
         
-        if scene_name not in config.get('scenes', {}):
-            return jsonify({
+        if deleted_channels is None:
+            return json_response({
                 "success": False,
                 "error": f"Scene '{scene_name}' not found"
-            }), 404
-        
-        deleted_channels = config['scenes'].pop(scene_name)
-        
-        if save_scenes_and_sequences(config):
-            return jsonify({
-                "success": True,
-                "message": f"Scene '{scene_name}' deleted successfully",
-                "data": {
-                    "name": scene_name,
-                    "channels": deleted_channels
-                }
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to save configuration"
-            }), 500
+            }, 404)
+        
+        return json_response({
+            "success": True,
+            "message": f"Scene '{scene_name}' deleted successfully",
+            "data": {
+                "name": scene_name,
+                "channels": deleted_channels
+            }
+        })
             
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/sequences', methods=['GET'])
 def get_sequences():
     """Get all sequences"""
     try:
-        config = load_scenes_and_sequences()
-        sequences = config.get('sequences', {})
-        return jsonify({
-            "success": True,
-            "data": sequences,
-            "count": len(sequences)
-        })
+        return entries_ok_response('sequences')
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/sequences/<sequence_name>', methods=['GET'])
 def get_sequence(sequence_name: str):
@@ -308,12 +471,12 @@ def get_sequence(sequence_name: str):
         sequences = config.get('sequences', {})
         
         if sequence_name not in sequences:
-            return jsonify({
+            return json_response({
                 "success": False,
                 "error": f"Sequence '{sequence_name}' not found"
-            }), 404
+            }, 404)
         
-        return jsonify({
+        return json_response({
             "success": True,
             "data": {
                 "name": sequence_name,
@@ -321,10 +484,10 @@ def get_sequence(sequence_name: str):
             }
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/sequences', methods=['POST'])
 def create_sequence():
@@ -333,106 +496,31 @@ def create_sequence():
         data = request.get_json()
         
         if not data or 'name' not in data or 'steps' not in data:
-            return jsonify({
+            return json_response({
                 "success": False,
                 "error": "Missing required fields: name and steps"
-            }), 400
+            }, 400)
         
         sequence_name = data['name']
         steps = data['steps']
         
         # Validate steps
-        if not isinstance(steps, list):
-            return jsonify({
+        encoded, error = validate_and_pack_steps(steps)
+        if error:
+            return json_response({
                 "success": False,
-                "error": "Steps must be a list"
-            }), 400
-        
-        # Validate each step
-        for i, step in enumerate(steps):
-            if not isinstance(step, dict):
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} must be an object"
-                }), 400
-            
-            if 'dmx' not in step:
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} missing required field: dmx"
-                }), 400
-            
-            if 'duration' not in step:
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} missing required field: duration"
-                }), 400
-            
-            # Validate DMX data
-            dmx_data = step['dmx']
-            if not isinstance(dmx_data, dict):
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} dmx field must be an object"
-                }), 400
-            
-            for channel, value in dmx_data.items():
-                try:
-                    channel_num = int(channel)
-                    if channel_num < 1 or channel_num > 512:
-                        return jsonify({
-                            "success": False,
-                            "error": f"Step {i+1} channel {channel} must be 1-512"
-                        }), 400
-                except ValueError:
-                    return jsonify({
-                        "success": False,
-                        "error": f"Step {i+1} channel {channel} must be a number"
-                    }), 400
-                
-                if not isinstance(value, int) or value < 0 or value > 255:
-                    return jsonify({
-                        "success": False,
-                        "error": f"Step {i+1} channel {channel} value must be 0-255"
-                    }), 400
-            
-            # Validate duration
-            try:
-                duration = float(step['duration'])
-                if duration < 0:
-                    return jsonify({
-                        "success": False,
-                        "error": f"Step {i+1} duration must be non-negative"
-                    }), 400
-            except (ValueError, TypeError):
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} duration must be a number"
-                }), 400
+                "error": error
+            }, 400)
         
-        config = load_scenes_and_sequences()
-        config['sequences'][sequence_name] = steps
-        
-        if save_scenes_and_sequences(config):
-            return jsonify({
-                "success": True,
-                "message": f"Sequence '{sequence_name}' created successfully",
-                "data": {
-                    "name": sequence_name,
-                    "steps": steps
-                }
-            }), 201
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to save configuration"
-            }), 500
+        put_config_entry('sequences', sequence_name, steps, encoded=encoded)
+        return entry_saved_response(f"Sequence '{sequence_name}' created successfully",
+                                    sequence_name, 'steps', encoded, 201)
             
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/sequences/<sequence_name>', methods=['PUT'])
 def update_sequence(sequence_name: str):
@@ -441,147 +529,62 @@ def update_sequence(sequence_name: str):
         data = request.get_json()
         
         if not data or 'steps' not in data:
-            return jsonify({
+            return json_response({
                 "success": False,
                 "error": "Missing required field: steps"
-            }), 400
+            }, 400)
         
         steps = data['steps']
         
-        # Validate steps (same validation as create_sequence)
-        if not isinstance(steps, list):
-            return jsonify({
+        # Validate steps
+        encoded, error = validate_and_pack_steps(steps)
+        if error:
+            return json_response({
                 "success": False,
-                "error": "Steps must be a list"
-            }), 400
-        
-        # Validate each step
-        for i, step in enumerate(steps):
-            if not isinstance(step, dict):
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} must be an object"
-                }), 400
-            
-            if 'dmx' not in step:
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} missing required field: dmx"
-                }), 400
-            
-            if 'duration' not in step:
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} missing required field: duration"
-                }), 400
-            
-            # Validate DMX data
-            dmx_data = step['dmx']
-            if not isinstance(dmx_data, dict):
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} dmx field must be an object"
-                }), 400
-            
-            for channel, value in dmx_data.items():
-                try:
-                    channel_num = int(channel)
-                    if channel_num < 1 or channel_num > 512:
-                        return jsonify({
-                            "success": False,
-                            "error": f"Step {i+1} channel {channel} must be 1-512"
-                        }), 400
-                except ValueError:
-                    return jsonify({
-                        "success": False,
-                        "error": f"Step {i+1} channel {channel} must be a number"
-                    }), 400
-                
-                if not isinstance(value, int) or value < 0 or value > 255:
-                    return jsonify({
-                        "success": False,
-                        "error": f"Step {i+1} channel {channel} value must be 0-255"
-                    }), 400
-            
-            # Validate duration
-            try:
-                duration = float(step['duration'])
-                if duration < 0:
-                    return jsonify({
-                        "success": False,
-                        "error": f"Step {i+1} duration must be non-negative"
-                    }), 400
-            except (ValueError, TypeError):
-                return jsonify({
-                    "success": False,
-                    "error": f"Step {i+1} duration must be a number"
-                }), 400
+                "error": error
+            }, 400)
         
-        config = load_scenes_and_sequences()
-        
-        if sequence_name not in config.get('sequences', {}):
-            return jsonify({
+        if not put_config_entry('sequences', sequence_name, steps, create=False, encoded=encoded):
+            return json_response({
                 "success": False,
                 "error": f"Sequence '{sequence_name}' not found"
-            }), 404
-        
-        config['sequences'][sequence_name] = steps
-        
-        if save_scenes_and_sequences(config):
-            return jsonify({
-                "success": True,
-                "message": f"Sequence '{sequence_name}' updated successfully",
-                "data": {
-                    "name": sequence_name,
-                    "steps": steps
-                }
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to save configuration"
-            }), 500
+            }, 404)
+        
+        return entry_saved_response(f"Sequence '{sequence_name}' updated successfully",
+                                    sequence_name, 'steps', encoded)
             
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/sequences/<sequence_name>', methods=['DELETE'])
 def delete_sequence(sequence_name: str):
     """Delete a sequence"""
     try:
-        config = load_scenes_and_sequences()
+        deleted_steps = pop_config_entry('sequences', sequence_name)
         
-        if sequence_name not in config.get('sequences', {}):
-            return jsonify({
+        if deleted_steps is None:
+            return json_response({
                 "success": False,
                 "error": f"Sequence '{sequence_name}' not found"
-            }), 404
-        
-        deleted_steps = config['sequences'].pop(sequence_name)
-        
-        if save_scenes_and_sequences(config):
-            return jsonify({
-                "success": True,
-                "message": f"Sequence '{sequence_name}' deleted successfully",
-                "data": {
-                    "name": sequence_name,
-                    "steps": deleted_steps
-                }
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to save configuration"
-            }), 500
+            }, 404)
+        
+        return json_response({
+            "success": True,
+            "message": f"Sequence '{sequence_name}' deleted successfully",
+            "data": {
+                "name": sequence_name,
+                "steps": deleted_steps
+            }
+        })
             
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/dmx/channel/<int:channel>', methods=['POST'])
 def set_channel(channel: int):
@@ -590,28 +593,28 @@ def set_channel(channel: int):
         data = request.get_json()
         
         if not data or 'value' not in data:
-            return jsonify({
+            return json_response({
                 "success": False,
                 "error": "Missing required field: value"
-            }), 400
+            }, 400)
         
         value = data['value']
         
-        if not isinstance(value, int) or value < 0 or value > 255:
-            return jsonify({
+        if not is_dmx_value(value):
+            return json_response({
                 "success": False,
                 "error": "Value must be 0-255"
-            }), 400
+            }, 400)
         
-        if channel < 1 or channel > 512:
-            return jsonify({
+        if not is_dmx_channel(channel):
+            return json_response({
                 "success": False,
                 "error": "Channel must be 1-512"
-            }), 400
+            }, 400)
         
         # TODO: Integrate with MQTT to send the channel command
         # For now, just return success
-        return jsonify({
+        return json_response({
             "success": True,
             "message": f"Channel {channel} set to {value}",
             "data": {
@@ -621,10 +624,10 @@ def set_channel(channel: int):
         })
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/dmx/scene/<scene_name>', methods=['POST'])
 def play_scene(scene_name: str):
@@ -637,14 +640,14 @@ def play_scene(scene_name: str):
         scenes = config.get('scenes', {})
         
         if scene_name not in scenes:
-            return jsonify({
+            return json_response({
                 "success": False,
                 "error": f"Scene '{scene_name}' not found"
-            }), 404
+            }, 404)
         
         # TODO: Integrate with MQTT to send the scene command
         # For now, just return success
-        return jsonify({
+        return json_response({
             "success": True,
             "message": f"Scene '{scene_name}' triggered with transition time {transition_time}s",
             "data": {
@@ -655,10 +658,10 @@ def play_scene(scene_name: str):
         })
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/dmx/sequence/<sequence_name>', methods=['POST'])
 def play_sequence(sequence_name: str):
@@ -668,14 +671,14 @@ def play_sequence(sequence_name: str):
         sequences = config.get('sequences', {})
         
         if sequence_name not in sequences:
-            return jsonify({
+            return json_response({
                 "success": False,
                 "error": f"Sequence '{sequence_name}' not found"
-            }), 404
+            }, 404)
         
         # TODO: Integrate with MQTT to send the sequence command
         # For now, just return success
-        return jsonify({
+        return json_response({
             "success": True,
             "message": f"Sequence '{sequence_name}' triggered",
             "data": {
@@ -685,10 +688,10 @@ def play_sequence(sequence_name: str):
         })
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500)
 
 if __name__ == '__main__':
     import argparse
@@ -697,6 +700,7 @@ if __name__ == '__main__':
     parser.add_argument('--config-dir', help='Directory containing settings.json and config.json files')
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to (default: 0.0.0.0)')
     parser.add_argument('--port', type=int, default=5000, help='Port to bind to (default: 5000)')
+    parser.add_argument('--threads', type=int, default=8, help='Worker threads for the production server (default: 8)')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     
     args = parser.parse_args()
@@ -707,4 +711,14 @@ if __name__ == '__main__':
     print(f"Starting Flask API server on {args.host}:{args.port}")
     print(f"Configuration directory: {args.config_dir or 'default'}")
     
-    app.run(host=args.host, port=args.port, debug=args.debug) 
\ No newline at end of file
+    if args.debug:
+        app.run(host=args.host, port=args.port, debug=True)
+    else:
+        # Scenes/sequences live in this process's memory, so scale with threads rather than worker processes
+        try:
+            from waitress import serve
+        except ImportError:
+            print("waitress not installed, falling back to the threaded Flask development server")
+            app.run(host=args.host, port=args.port, threaded=True)
+        else:
+            serve(app, host=args.host, port=args.port, threads=args.threads) 
\ No newline at end of file
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+orjson-backed JSON provider for Flask
+Makes jsonify() and request.get_json() use orjson when it is installed
+"""
+
+from flask import Flask
+
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+    ORJSON_PROVIDER_AVAILABLE = True
+except ImportError:
+    # orjson is not installed, or Flask < 2.2 has no pluggable provider
+    ORJSON_PROVIDER_AVAILABLE = False
+
+
+if ORJSON_PROVIDER_AVAILABLE:
+    class OrjsonProvider(JSONProvider):
+        """JSON provider that serializes with orjson"""
+
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            """Build the jsonify() response from orjson's bytes, skipping the str round trip"""
+            obj = self._prepare_response_obj(args, kwargs)
+            body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+            return self._app.response_class(body, mimetype="application/json")
+
+
+def install_json_provider(app: Flask) -> bool:
+    """Use orjson for the app's JSON encoding if available, returns True if installed"""
+    if not ORJSON_PROVIDER_AVAILABLE:
+        return False
+    app.json = OrjsonProvider(app)
+    return True